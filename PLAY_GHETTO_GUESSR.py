@@ -10,13 +10,15 @@
 
 # last revision 11-14-2024
 
+import time
 import tkinter as tk
 from tkinter import messagebox
 from PIL import Image, ImageTk
-import requests
 from io import BytesIO
-from round_data_maker import make_round_data
+from round_data_maker import make_round_data, ROUND_BUDGET
+from page_fetcher import fetch_bytes, REQUEST_TIMEOUT
 from link_file_maker import generate_listings_file
+from results_store import ResultsStore
 
 # Constant Game data for gameplay tuning purposes
 ROUNDS = 5  # Number of rounds
@@ -25,13 +27,15 @@ PLAYER_COUNT = 4  # Number of players
 
 
 class GhettoGusserGame:
-    def __init__(self, master, round_data):
+    def __init__(self, master, round_data, results=None):
         """
         Initialize the GhettoGusserGame with GUI elements and game state.
 
         Args:
             master (tk.Tk): The root window for the GUI.
-            round_data (list): List of dictionaries containing round data.
+            round_data (list): List of Listing records containing round data.
+            results (ResultsStore, optional): Where finished games are
+                recorded. Opens the default results log if None.
         """
         self.master = master
         self.master.title("GhettoGusser")
@@ -41,7 +45,9 @@ class GhettoGusserGame:
         self.round_data = round_data
         self.current_round = 0
         self.scores = [0] * PLAYER_COUNT
+        self.round_history = []  # Price, guesses & scores of each round
         self.entries = []
+        self.results = results if results is not None else ResultsStore()
 
         # Setup GUI and elements
         self.create_widgets()
@@ -188,8 +194,20 @@ class GhettoGusserGame:
 
             # Load and process the image
             image_url = listing['photo']
-            response = requests.get(image_url)
-            image = Image.open(BytesIO(response.content))
+            try:
+                # Each image gets its own REQUEST_TIMEOUT deadline
+                content = fetch_bytes(
+                    image_url,
+                    time.monotonic() + REQUEST_TIMEOUT
+                    )
+                image = Image.open(BytesIO(content))
+            except Exception as e:
+                # Don't let one slow or broken image stall the game
+                print(f"ERROR: {e}")
+                self.image_label.config(image="", text="[Image unavailable]")
+                self.image_label.image = None
+                self.description_label.config(text=f"{listing['description']}")
+                return
 
             # Scale down the image if its height is greater than a certain size
             if image.height > 300:
@@ -233,6 +251,7 @@ class GhettoGusserGame:
 
         # Calculate scores, no points if over actual price
         round_details = f"Actual Price: ${actual_price}\nOriginal Listing: {listing['url']}\n\n"
+        round_scores = []
         for i, guess in enumerate(guesses):
             if guess == 0 or guess > actual_price:
                 # No points for guesses over the actual price or zero
@@ -244,8 +263,16 @@ class GhettoGusserGame:
                 score = int(MAX_SCORE * ratio)
 
             self.scores[i] += score
+            round_scores.append(score)
             round_details += f"Player {i + 1}'s Guess: ${guess} | Score: {score}\n"
 
+        # Keep the round for the results log
+        self.round_history.append({
+            "price": actual_price,
+            "guesses": guesses,
+            "scores": round_scores,
+            })
+
         # Update score label
         total_scores = "\n".join([f"Player {i + 1}: {self.scores[i]} points" for i in range(PLAYER_COUNT)])
         self.score_label.config(text=f"{round_details}\n\nTotal Scores:\n{total_scores}")
@@ -280,10 +307,21 @@ class GhettoGusserGame:
         max_score = max(self.scores)
         winners = [i + 1 for i, score in enumerate(self.scores) if score == max_score]
 
+        # Save the finished game, a single local game is synced right away
+        self.results.record_game(
+            self.round_history,
+            {f"Player {i + 1}": self.scores[i] for i in range(PLAYER_COUNT)}
+            )
+        self.results.flush()
+
         # Format scores for display
         scores_text = "\n".join(
             [f"Player {i + 1}: {self.scores[i]} points" for i in range(PLAYER_COUNT)]
             )
+        best_scores_text = "\n".join(
+            f"{player}: {score} points (game {game_id})"
+            for player, score, game_id in self.results.top_scores(3)
+            )
 
         if len(winners) > 1:
             # Handle tie case
@@ -300,6 +338,8 @@ class GhettoGusserGame:
                 f"Congratulations!"
                 )
 
+        final_message += f"\n\nBest Games Ever:\n{best_scores_text}"
+
         # Create end-game window
         end_window = tk.Toplevel(self.master)
         end_window.title("Game Over")
@@ -349,11 +389,18 @@ class GhettoGusserGame:
         """Restart the game, generating new data and resetting scores."""
         end_window.destroy()  # Close the end-game window
 
+        # Preparation gets ROUND_BUDGET seconds total before falling back to
+        # cached listings
+        deadline = time.monotonic() + ROUND_BUDGET
+
         # Regenerate the link file
-        generate_listings_file("https://stockton.craigslist.org/search/sss")
+        generate_listings_file(
+            "https://stockton.craigslist.org/search/sss",
+            deadline
+            )
 
         # Generate new round data
-        round_data = make_round_data('cl_listings_file.txt')
+        round_data = make_round_data('cl_listings_file.txt', deadline)
 
         # Check if there are enough listings
         # Really should never be seen unless something goes really wrong
@@ -368,16 +415,25 @@ class GhettoGusserGame:
         # Reset game state
         self.round_data = round_data  # Update with new round data
         self.scores = [0] * PLAYER_COUNT  # Reset scores
+        self.round_history = []  # Reset round history
         self.current_round = 0  # Reset round counter
         self.display_round()  # Start game
 
-    # I think this is a duplicate, but removing it seems to break regeneration of round data
-    generate_listings_file("https://stockton.craigslist.org/search/sss")
-
 
 def main():
+    # Preparation gets ROUND_BUDGET seconds total before falling back to
+    # cached listings
+    deadline = time.monotonic() + ROUND_BUDGET
+
+    # Refresh the link file, this used to happen when the game class was
+    # defined at import time, outside of any deadline
+    generate_listings_file(
+        "https://stockton.craigslist.org/search/sss",
+        deadline
+        )
+
     # Generate round data
-    round_data = make_round_data('cl_listings_file.txt')
+    round_data = make_round_data('cl_listings_file.txt', deadline)
 
     # Ensure enough listings in round data, never seen this in play test
     # hopefully I never will but just in case
@@ -390,8 +446,10 @@ def main():
 
     # Start game
     root = tk.Tk()
-    game = GhettoGusserGame(root, round_data)
+    results = ResultsStore()
+    game = GhettoGusserGame(root, round_data, results)
     root.mainloop()
+    results.close()
     # I do not know why this is needed, works without it but throws syntax error?
     game
 
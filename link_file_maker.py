@@ -9,11 +9,13 @@
 
 
 import os
+import time
 import requests
 from bs4 import BeautifulSoup
+from page_fetcher import fetch_page, REQUEST_TIMEOUT
 
 
-def generate_listings_file(url):
+def generate_listings_file(url, deadline=None):
     """
     Collect all links from a Craigslist search page and save them to a text
     file.
@@ -23,12 +25,20 @@ def generate_listings_file(url):
     2. Saves the collected links to a file named 'cl_listings_file.txt' in the
        script's parent directory.
 
+    If the search page can't be fetched before the deadline the existing link
+    file is left as is.
+
     Args:
         url (str): The URL of the Craigslist search page to scrape.
+        deadline (float, optional): time.monotonic() timestamp to give up on
+            the search page at. Defaults to REQUEST_TIMEOUT seconds from now.
 
     Returns:
         str: The path to the generated text file containing the links.
     """
+    if deadline is None:
+        deadline = time.monotonic() + REQUEST_TIMEOUT
+
     # Get the path to the script's parent folder
     parent_folder = os.path.dirname(os.path.abspath(__file__))
     output_file_path = os.path.join(parent_folder, "cl_listings_file.txt")
@@ -56,8 +66,8 @@ def generate_listings_file(url):
                 "(KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
             )
         }
-        response = requests.get(url, headers=headers)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        page = fetch_page(url, deadline, headers=headers)
+        soup = BeautifulSoup(page, 'html.parser')
 
         # Find all links (to listings) on the page and store them in a list
         links = []
@@ -69,7 +79,11 @@ def generate_listings_file(url):
                 links.append(full_url)
         return links
 
-    all_links = collect_links(url)
+    try:
+        all_links = collect_links(url)
+    except requests.RequestException as e:
+        print(f"ERROR: {e}")
+        return output_file_path
 
     # Save links to a file in the script's folder
     def save_links_to_file(links, filename):
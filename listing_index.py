@@ -0,0 +1,136 @@
+# GhettoGusser - Remake of 'Ghetto Price is Right' from 2022 CCOMP-11p class
+# Originally by Story on the Programming Discord, re-made Chase Varvayanis
+# linted w/ FLAKE8, spellchecked w/ StreetSideSoftware's Spell Checker
+
+# listing_index module; Content fingerprints for Craigslist listings so reposts
+# of the same item under new URLs can be collapsed. Keeps a persistent
+# url -> fingerprint index in 'cl_fingerprint_index.txt' in the script's
+# parent directory, appended to as new listings are fingerprinted
+
+# last revision 10-19-2026
+
+
+import os
+import re
+from hashlib import blake2b
+
+INDEX_FILENAME = "cl_fingerprint_index.txt"
+
+
+def normalize_text(text):
+    """
+    Lowercase text and strip punctuation and extra whitespace so small edits
+    between reposts (spacing, emoji, capitalization) hash the same.
+    """
+    text = re.sub(r'[^a-z0-9]+', ' ', (text or '').lower())
+    return text.strip()
+
+
+def normalize_photo(photo_url):
+    """
+    Reduce a Craigslist image URL to its image id, dropping the size suffix
+    (e.g. '_600x450.jpg') so the same photo at different sizes matches.
+    """
+    if not photo_url:
+        return ''
+    name = photo_url.rsplit('/', 1)[-1]
+    return re.sub(r'_\d+x\d+.*$', '', name.split('.')[0])
+
+
+def listing_fingerprint(title, description, photo_url):
+    """
+    Build a content fingerprint for a listing from its normalized title,
+    description, and main photo.
+
+    Args:
+        title (str): Listing title, before price redaction.
+        description (str): Listing description, before price redaction.
+        photo_url (str): Main photo URL.
+
+    Returns:
+        str: A 32 character hex digest.
+    """
+    content = "\x1f".join((
+        normalize_text(title),
+        normalize_text(description),
+        normalize_photo(photo_url),
+    ))
+    return blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class FingerprintIndex:
+    """
+    Persistent url -> fingerprint index with O(1) lookups.
+
+    Loaded once from the index file, new entries are held in memory and
+    appended to the file by save(), so the file only ever grows and never has
+    to be rewritten.
+    """
+
+    def __init__(self, filename=INDEX_FILENAME):
+        parent_folder = os.path.dirname(os.path.abspath(__file__))
+        self.path = os.path.join(parent_folder, filename)
+        self.by_url = {}
+        self._unsaved = []
+
+        if os.path.exists(self.path):
+            with open(self.path) as file:
+                for line in file:
+                    url, _, fingerprint = line.rstrip("\n").partition("\t")
+                    if url and fingerprint:
+                        self.by_url[url] = fingerprint
+
+    def __len__(self):
+        return len(self.by_url)
+
+    def __contains__(self, url):
+        return url in self.by_url
+
+    def get(self, url):
+        """Return the known fingerprint for url, or None."""
+        return self.by_url.get(url)
+
+    def add(self, url, fingerprint):
+        """Record the fingerprint for url, to be written on the next save."""
+        if self.by_url.get(url) != fingerprint:
+            self.by_url[url] = fingerprint
+            self._unsaved.append((url, fingerprint))
+
+    def unique_links(self, links):
+        """
+        Filter a list of links down to one link per listing.
+
+        Drops repeated URLs, and URLs already known to point at the same
+        content as an earlier link in the list. Links that have not been
+        fingerprinted yet are always kept.
+
+        Args:
+            links (list): Listing URLs, in order.
+
+        Returns:
+            list: The links with duplicates removed, order preserved.
+        """
+        seen_urls = set()
+        seen_fingerprints = set()
+        unique = []
+        for url in links:
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+
+            fingerprint = self.by_url.get(url)
+            if fingerprint is not None:
+                if fingerprint in seen_fingerprints:
+                    continue
+                seen_fingerprints.add(fingerprint)
+            unique.append(url)
+        return unique
+
+    def save(self):
+        """Append any new entries to the index file."""
+        if not self._unsaved:
+            return
+        with open(self.path, 'a') as file:
+            for url, fingerprint in self._unsaved:
+                file.write(f"{url}\t{fingerprint}\n")
+        self._unsaved.clear()
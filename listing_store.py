@@ -0,0 +1,141 @@
+# GhettoGusser - Remake of 'Ghetto Price is Right' from 2022 CCOMP-11p class
+# Originally by Story on the Programming Discord, re-made Chase Varvayanis
+# linted w/ FLAKE8, spellchecked w/ StreetSideSoftware's Spell Checker
+
+# listing_store module; Slotted in-memory record for listing data. Listing
+# reads like the old data_dict (listing['title']) but skips the per-listing
+# dict. Only the dict overhead is saved (about 10% per listing), the strings
+# themselves are unchanged since their bytes are most of a listing's size
+
+# last revision 10-19-2026
+
+
+# Field order of a Listing, matches the keys of the old data_dict
+FIELDS = ("url", "title", "description", "photo", "price")
+
+
+class Listing:
+    """
+    A single Craigslist listing.
+
+    Uses __slots__ instead of a per-object dict, but still supports the
+    dictionary style reads the game uses (listing['price'], 'price' in
+    listing, iterating over its keys). Like a dict it is mutable and so
+    unhashable.
+    """
+    __slots__ = FIELDS
+
+    def __init__(self, url, title, description, photo, price):
+        self.url = url
+        self.title = title
+        self.description = description
+        self.photo = photo
+        self.price = price
+
+    def __getitem__(self, key):
+        """Read a field by name, like a dictionary."""
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in FIELDS
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def __eq__(self, other):
+        if not isinstance(other, Listing):
+            return NotImplemented
+        return self.values() == other.values()
+
+    # Defining __eq__ already drops the default hash, this makes it explicit
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Listing(url={self.url!r}, price={self.price!r})"
+
+    def get(self, key, default=None):
+        """Read a field by name, returning default if it is not a field."""
+        return getattr(self, key) if key in FIELDS else default
+
+    def keys(self):
+        return FIELDS
+
+    def values(self):
+        return tuple(getattr(self, field) for field in FIELDS)
+
+    def items(self):
+        return tuple(zip(FIELDS, self.values()))
+
+    def is_complete(self):
+        """True if every field is populated (no None values)."""
+        return None not in self.values()
+
+    def to_dict(self):
+        """Return the listing as a plain dictionary."""
+        return dict(self.items())
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Listing from a dictionary with the same keys."""
+        return cls(*(data.get(field) for field in FIELDS))
+
+
+# Test Code
+# Compares the memory cost of plain dicts against Listing records
+if __name__ == '__main__':
+    import tracemalloc
+
+    LISTING_COUNT = 20000
+
+    def fake_listing_fields(i):
+        return {
+            "url": (
+                "https://sacramento.craigslist.org/fuo/d/listing/"
+                f"{7800000000 + i}.html"
+            ),
+            "title": f"Gently used recliner chair number {i}",
+            "description": (
+                f"Selling a comfy recliner #{i}, no rips or stains, pick up "
+                "only, cash or venmo. Must go this weekend. " * 4
+            ),
+            "photo": (
+                f"https://images.craigslist.org/00{i:06d}_abcDEF123"
+                "_600x450.jpg"
+            ),
+            "price": 40 + i % 500,
+        }
+
+    def measure(build):
+        """Return bytes per listing allocated by build()'s result."""
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            built = build()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        used = sum(
+            stat.size_diff for stat in after.compare_to(before, 'filename')
+            )
+        return used / len(built)
+
+    results = {
+        "dict": measure(
+            lambda: [fake_listing_fields(i) for i in range(LISTING_COUNT)]
+            ),
+        "Listing": measure(
+            lambda: [
+                Listing.from_dict(fake_listing_fields(i))
+                for i in range(LISTING_COUNT)
+                ]
+            ),
+    }
+
+    print(f"Memory per listing over {LISTING_COUNT} listings:")
+    for name, per_listing in results.items():
+        print(f"{name:>12}: {per_listing:8.1f} bytes")
@@ -0,0 +1,154 @@
+# GhettoGusser - Remake of 'Ghetto Price is Right' from 2022 CCOMP-11p class
+# Originally by Story on the Programming Discord, re-made Chase Varvayanis
+# linted w/ FLAKE8, spellchecked w/ StreetSideSoftware's Spell Checker
+
+# page_fetcher module; Deadline-bounded downloads shared by the link file
+# maker, the round data maker, and the game's image loading. requests' own
+# timeout only limits each connect or read, so a server that trickles bytes
+# can run past it forever. Here the download runs on a worker thread and the
+# caller stops waiting at the deadline no matter what the server is doing
+
+# last revision 10-19-2026
+
+
+import time
+import threading
+import requests
+
+REQUEST_TIMEOUT = 5  # Longest any single request may take, in seconds
+
+
+def request_timeout(deadline):
+    """
+    Returns the timeout to use for the next request, the smaller of
+    REQUEST_TIMEOUT and the time left before the deadline (a monotonic
+    timestamp). Returns 0 if the deadline has passed.
+    """
+    return max(0, min(REQUEST_TIMEOUT, deadline - time.monotonic()))
+
+
+def _download(url, deadline, headers=None):
+    """
+    Downloads url on a worker thread and waits for it until the deadline (a
+    time.monotonic() timestamp) at most.
+
+    Returns:
+        tuple: The response body (bytes) and its encoding (str or None).
+
+    Raises:
+        requests.Timeout: If the deadline is reached first.
+        requests.RequestException: If the request itself fails.
+    """
+    timeout = request_timeout(deadline)
+    if timeout <= 0:
+        raise requests.Timeout(f"Deadline already passed for {url}")
+
+    result = {}
+    responses = []  # Lets the caller close a download it gave up on
+    gave_up = threading.Event()
+
+    def download():
+        try:
+            with requests.get(
+                url, headers=headers, timeout=timeout, stream=True
+            ) as response:
+                responses.append(response)
+                response.raise_for_status()
+                chunks = []
+                for chunk in response.iter_content(chunk_size=16384):
+                    if gave_up.is_set():
+                        return
+                    chunks.append(chunk)
+                result["content"] = b"".join(chunks)
+                result["encoding"] = response.encoding
+        except Exception as e:
+            result["error"] = e
+
+    worker = threading.Thread(target=download, daemon=True)
+    worker.start()
+    worker.join(max(0, deadline - time.monotonic()))
+
+    if worker.is_alive():
+        # Stop waiting and close the connection so the abandoned worker ends.
+        # Closing waits on the worker's read, so it gets its own thread too
+        gave_up.set()
+        for response in responses:
+            threading.Thread(target=response.close, daemon=True).start()
+        raise requests.Timeout(f"Deadline reached fetching {url}")
+    if "error" in result:
+        raise result["error"]
+    return result["content"], result["encoding"]
+
+
+def fetch_bytes(url, deadline, headers=None):
+    """
+    Downloads url and returns its body as bytes, giving up once the deadline
+    (a time.monotonic() timestamp) passes.
+
+    Raises:
+        requests.Timeout: If the deadline is reached.
+        requests.RequestException: If the request fails.
+    """
+    content, _ = _download(url, deadline, headers)
+    return content
+
+
+def fetch_page(url, deadline, headers=None):
+    """
+    Downloads a page and returns its text, giving up once the deadline (a
+    time.monotonic() timestamp) passes.
+
+    Raises:
+        requests.Timeout: If the deadline is reached.
+        requests.RequestException: If the request fails.
+    """
+    content, encoding = _download(url, deadline, headers)
+    return content.decode(encoding or 'utf-8', errors='replace')
+
+
+# Test Code
+# Checks the deadline holds against a local server that drips one byte every
+# 0.2 seconds, which never trips requests' per-read timeout
+if __name__ == '__main__':
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class SlowHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = b"ok" if self.path == "/fast" else b"x" * 1000
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            try:
+                if self.path == "/fast":
+                    self.wfile.write(body)
+                    return
+                for byte in body:
+                    self.wfile.write(bytes([byte]))
+                    self.wfile.flush()
+                    time.sleep(0.2)
+            except OSError:
+                pass  # Client hung up, expected once it gives up
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    text = fetch_page(base_url + "/fast", time.monotonic() + 2)
+    assert text == "ok", text
+    print("Fast page fetched before the deadline.")
+
+    start = time.monotonic()
+    try:
+        fetch_page(base_url + "/slow", start + 2)
+    except requests.Timeout:
+        pass
+    else:
+        raise AssertionError("slow page finished, expected a timeout")
+    elapsed = time.monotonic() - start
+    assert elapsed < 2.5, elapsed
+    print(f"Slow page gave up after {elapsed:.2f}s with a 2s deadline.")
+
+    server.shutdown()
@@ -0,0 +1,303 @@
+# GhettoGusser - Remake of 'Ghetto Price is Right' from 2022 CCOMP-11p class
+# Originally by Story on the Programming Discord, re-made Chase Varvayanis
+# linted w/ FLAKE8, spellchecked w/ StreetSideSoftware's Spell Checker
+
+# results_store module; Keeps a history of finished games in an append-only
+# log named 'gg_results_log.jsonl' in the script's parent directory, one JSON
+# object per game. Per-player totals and a best-scores leaderboard are kept up
+# to date as games are recorded so they never need the history rescanned.
+# Several games or processes can share the log, appends are made under a lock
+
+# last revision 10-19-2026
+
+
+import os
+import json
+import errno
+import time
+import heapq
+from bisect import insort
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows has no fcntl, lock with msvcrt instead
+    fcntl = None
+    import msvcrt
+
+RESULTS_FILENAME = "gg_results_log.jsonl"
+FSYNC_BATCH = 256  # Games written between each fsync of the log
+LEADERBOARD_SIZE = 100  # Best single-game scores kept in the leaderboard
+
+
+def _lock(file):
+    """Block until this process holds the exclusive lock on file."""
+    if fcntl:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+    else:
+        # LK_LOCK gives up with OSError after about 10 seconds, keep trying
+        # so a busy writer makes us wait instead of failing
+        while True:
+            file.seek(0)
+            try:
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError as e:
+                if e.errno != errno.EDEADLOCK:
+                    raise  # A real error, not just another writer's lock
+
+
+def _unlock(file):
+    """Release the lock taken by _lock."""
+    if fcntl:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class ResultsStore:
+    """
+    Append-only store of finished games with incremental aggregates.
+
+    The log is read once when the store is opened to rebuild the aggregates,
+    after that each recorded game is appended to the log and folded into the
+    aggregates directly. Games are written to the OS straight away but only
+    fsynced every fsync_batch games, call flush() to force everything so far
+    to disk.
+
+    Any number of stores, in this or other processes, can share one log. Each
+    append happens under an exclusive lock on a '.lock' file next to the log,
+    after first reading whatever other writers added since this store last
+    looked, so game ids stay unique and the aggregates stay current. Queries
+    catch up the same way, only ever reading the new end of the log. A torn
+    last line left by a crash is cut off before the next append.
+    """
+
+    def __init__(self, filename=RESULTS_FILENAME, fsync_batch=FSYNC_BATCH):
+        parent_folder = os.path.dirname(os.path.abspath(__file__))
+        self.path = os.path.join(parent_folder, filename)
+        self.fsync_batch = fsync_batch
+
+        self.game_count = 0
+        # Player name -> {"games", "total_score", "best_score", "wins"}
+        self.stats = {}
+        # Sorted (-score, game_id, player) tuples, best first
+        self.leaderboard = []
+
+        self._file = open(self.path, 'a+b')
+        self._lock_file = open(self.path + ".lock", 'a+b')
+        self._offset = 0  # End of the last complete line read from the log
+        self._unsynced = 0
+        self.refresh()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @contextmanager
+    def _locked(self):
+        """Hold the log's lock for the duration of a with block."""
+        _lock(self._lock_file)
+        try:
+            yield
+        finally:
+            _unlock(self._lock_file)
+
+    def _catch_up(self):
+        """
+        Fold in every complete line added to the log since the last read.
+        Must be called with the lock held. Anything after the last newline
+        can only be a torn write from a crashed writer, so it is truncated.
+        """
+        self._file.seek(self._offset)
+        data = self._file.read()
+        end = data.rfind(b"\n") + 1
+
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Skip a corrupt line rather than lose the rest
+            self._apply(record)
+
+        self._offset += end
+        if end < len(data):
+            self._file.truncate(self._offset)
+
+    def refresh(self):
+        """Pick up any games other writers have added to the log."""
+        with self._locked():
+            self._catch_up()
+
+    def _apply(self, record):
+        """Fold one game record into the aggregates and leaderboard."""
+        game_id = record["game"]
+        self.game_count = max(self.game_count, game_id)
+
+        scores = record["scores"]
+        best = max(scores.values(), default=0)
+        for player, score in scores.items():
+            player_stats = self.stats.setdefault(player, {
+                "games": 0,
+                "total_score": 0,
+                "best_score": 0,
+                "wins": 0,
+                })
+            player_stats["games"] += 1
+            player_stats["total_score"] += score
+            player_stats["best_score"] = max(player_stats["best_score"], score)
+            # Nobody wins a game where no one scored
+            if best > 0 and score == best:
+                player_stats["wins"] += 1
+
+            if (len(self.leaderboard) < LEADERBOARD_SIZE
+                    or -score < self.leaderboard[-1][0]):
+                insort(self.leaderboard, (-score, game_id, player))
+                del self.leaderboard[LEADERBOARD_SIZE:]
+
+    def record_game(self, rounds, scores):
+        """
+        Append a finished game to the log.
+
+        Args:
+            rounds (list): One dictionary per round with the listing "price",
+                each player's "guesses", and each player's round "scores".
+            scores (dict): Player name -> final score.
+
+        Returns:
+            int: The id of the recorded game.
+        """
+        with self._locked():
+            # Take the next id from the end of the log, not just this store
+            self._catch_up()
+            record = {
+                "game": self.game_count + 1,
+                "time": time.time(),
+                "rounds": rounds,
+                "scores": scores,
+            }
+            line = json.dumps(record, separators=(',', ':')) + "\n"
+            line = line.encode('utf-8')
+
+            # Hand the whole line to the OS before unlocking so other writers
+            # never see half of it
+            self._file.write(line)
+            self._file.flush()
+            self._offset += len(line)
+            self._apply(record)
+
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_batch:
+                self.flush()
+        return record["game"]
+
+    def flush(self):
+        """Write any buffered games to the log and fsync it."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        """Flush the log and close it."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+            self._lock_file.close()
+
+    def top_scores(self, n=10):
+        """
+        Return the n best single-game scores as (player, score, game_id)
+        tuples, best first. n is limited to LEADERBOARD_SIZE.
+        """
+        self.refresh()
+        return [
+            (player, -neg_score, game_id)
+            for neg_score, game_id, player in self.leaderboard[:n]
+            ]
+
+    def top_players(self, n=10, stat="total_score"):
+        """
+        Return the n players with the highest value of stat as
+        (player, value) tuples, best first.
+        """
+        self.refresh()
+        best = heapq.nlargest(
+            n,
+            self.stats.items(),
+            key=lambda item: item[1][stat]
+            )
+        return [(player, player_stats[stat]) for player, player_stats in best]
+
+    def player_stats(self, player):
+        """
+        Return a copy of a player's aggregate stats, with their average score
+        added, or None if the player has no recorded games.
+        """
+        self.refresh()
+        if player not in self.stats:
+            return None
+        player_stats = dict(self.stats[player])
+        player_stats["average_score"] = (
+            player_stats["total_score"] / player_stats["games"]
+            )
+        return player_stats
+
+
+# Test Code
+# Write throughput benchmark against a throwaway log file
+if __name__ == '__main__':
+    import tempfile
+    from random import randint
+
+    GAME_COUNT = 20000
+    PLAYERS = [f"Player {i + 1}" for i in range(4)]
+
+    def fake_game():
+        rounds = []
+        totals = dict.fromkeys(PLAYERS, 0)
+        for _ in range(5):
+            price = randint(5, 2000)
+            guesses = [randint(0, 2000) for _ in PLAYERS]
+            round_scores = [
+                0 if guess == 0 or guess > price
+                else int(10000 * guess / price)
+                for guess in guesses
+                ]
+            for player, score in zip(PLAYERS, round_scores):
+                totals[player] += score
+            rounds.append(
+                {"price": price, "guesses": guesses, "scores": round_scores}
+                )
+        return rounds, totals
+
+    games = [fake_game() for _ in range(GAME_COUNT)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_path = os.path.join(temp_dir, RESULTS_FILENAME)
+
+        with ResultsStore(log_path) as store:
+            start = time.perf_counter()
+            for rounds, scores in games:
+                store.record_game(rounds, scores)
+            store.flush()
+            elapsed = time.perf_counter() - start
+
+        print(
+            f"Recorded {GAME_COUNT} games in {elapsed:.2f}s "
+            f"({GAME_COUNT / elapsed:,.0f} games/sec, fsync every "
+            f"{FSYNC_BATCH} games)"
+            )
+
+        start = time.perf_counter()
+        reopened = ResultsStore(log_path)
+        print(
+            f"Rebuilt aggregates from log in "
+            f"{time.perf_counter() - start:.2f}s"
+            )
+        print(f"Top scores: {reopened.top_scores(3)}")
+        print(f"Top players: {reopened.top_players(4, 'wins')}")
+        print(f"Player 1: {reopened.player_stats('Player 1')}")
+        reopened.close()
@@ -12,36 +12,92 @@
 
 
 import os
-import requests
+import json
+import time
 from bs4 import BeautifulSoup
 from random import sample
 import re
+from listing_store import Listing
+from listing_index import FingerprintIndex, listing_fingerprint
+from page_fetcher import fetch_page, request_timeout
 
+# Total time allowed to prepare a game's round data, in seconds
+ROUND_BUDGET = 20
 
-def make_round_data(filename):
+# Previously scraped listings, used to fill rounds when time runs out
+CACHE_FILENAME = "cl_listing_cache.jsonl"
+CACHE_SIZE = 500  # Most listings kept in the cache, oldest are dropped
+
+
+def make_round_data(filename, deadline=None):
     """
     Generates round data by extracting valid Craigslist listings from the
-    link file, storing the data as a list of dictionaries. Includes a nested
-    function to trim the list to 5 elements for the final round.
+    link file, storing the data as a list of Listing records. Includes a nested
+    function to trim the list to 5 elements for the final round. Reposts of
+    the same listing are collapsed using the persistent fingerprint index.
+
+    Scraping stops when the deadline (a time.monotonic() timestamp, defaults
+    to ROUND_BUDGET seconds from now) is reached, and any missing rounds are
+    filled from previously scraped listings in the listing cache. The cache
+    is loaded before scraping starts and holds at most CACHE_SIZE listings,
+    so the fallback itself takes next to no time.
     """
+    if deadline is None:
+        deadline = time.monotonic() + ROUND_BUDGET
+
+    parent_folder = os.path.dirname(os.path.abspath(__file__))
+    cache_path = os.path.join(parent_folder, CACHE_FILENAME)
+
+    index = FingerprintIndex()
+    seen_fingerprints = set()  # Content already accepted this game
+    fresh_listings = []  # (fingerprint, listing) pairs to add to the cache
+
+    def load_cache():
+        """
+        Reads the listing cache into a fingerprint -> Listing dictionary,
+        oldest first. Reposts in the cache only count once.
+        """
+        cached = {}
+        if not os.path.exists(cache_path):
+            return cached
+
+        with open(cache_path) as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Skip a partially written line
+                fingerprint = record.pop("fingerprint", None)
+                listing = Listing.from_dict(record)
+                if fingerprint and listing.is_complete():
+                    cached.pop(fingerprint, None)  # Move to newest
+                    cached[fingerprint] = listing
+        return cached
+
+    # Loaded up front, while there is still time in the budget
+    cached = load_cache()
 
     def link_list_trimmer():
         """
         Trims the list of Craigslist listings to be more easily parsable by
         gathering x random links from the Craigslist search result file and
-        storing them in a list.
+        storing them in a list. Links known to be reposts of each other are
+        collapsed to one before sampling.
         """
         all_links = []
 
-        parent_folder = os.path.dirname(os.path.abspath(__file__))
         file_to_open = os.path.join(parent_folder, filename)
+        if not os.path.exists(file_to_open):
+            return all_links  # Nothing to scrape, rounds come from the cache
 
         with open(file_to_open) as file:
             for line in file:
                 all_links.append(line.rstrip())
 
         all_links = all_links[2:]  # Skip first two lines bc they're garbage
-        return sample(all_links, 15)  # Return x random links
+        all_links = index.unique_links(all_links)
+        # Return x random links
+        return sample(all_links, min(15, len(all_links)))
 
     def redact_price(text, price):
         """
@@ -110,13 +166,16 @@ def make_round_data(filename):
     def extract_craigslist_data(url):
         """
         Extracts data from a Craigslist URL, including the title, price, photo
-        link, and description. Returns a dictionary if all fields are valid,
-        or None otherwise.
+        link, and description. Returns a Listing if all fields are valid,
+        or None otherwise. Also returns None for reposts of a listing already
+        accepted this game, before any redaction work is done on them.
         """
+        # Skip the fetch entirely if this URL is a known repost
+        if index.get(url) in seen_fingerprints:
+            return None
+
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(fetch_page(url, deadline), 'html.parser')
 
             # Extract the title
             title = soup.find('span', id='titletextonly')
@@ -137,10 +196,6 @@ def make_round_data(filename):
             else:
                 price = None
 
-            # Redact price from the title
-            if title:
-                title = redact_price(title, price)
-
             # Extract the main photo link
             main_photo = soup.find('img')
             main_photo = (
@@ -155,28 +210,83 @@ def make_round_data(filename):
             # Shorten to 800 characters for formatting
             description = description[:600]
 
+            # Fingerprint the raw content and drop reposts of listings
+            # already in this game
+            fingerprint = listing_fingerprint(title, description, main_photo)
+            index.add(url, fingerprint)
+            if fingerprint in seen_fingerprints:
+                return None
+
+            # Redact price from the title
+            if title:
+                title = redact_price(title, price)
+
             # Redact price from the description
             if description:
                 description = redact_price(description, price)
 
-            # Create the dictionary
-            data_dict = {
-                "url": url,
-                "title": title,
-                "description": description,
-                "photo": main_photo,
-                "price": price,
-                }
-
-            # Discard dictionary if any field is None
-            if None in data_dict.values():
+            # Create the listing record
+            listing = Listing(url, title, description, main_photo, price)
+
+            # Discard listing if any field is None
+            if not listing.is_complete():
                 return None
-            return data_dict
+            seen_fingerprints.add(fingerprint)
+            fresh_listings.append((fingerprint, listing))
+            return listing
 
         except Exception as e:
             print(f"ERROR: {e}")
             return None
 
+    def save_to_cache():
+        """
+        Adds the listings scraped this game to the listing cache, one JSON
+        object per line, so later games can fall back on them. Listings
+        already cached are skipped, and once the cache passes CACHE_SIZE it
+        is rewritten with only the newest CACHE_SIZE listings.
+        """
+        new_listings = [
+            (fingerprint, listing)
+            for fingerprint, listing in fresh_listings
+            if fingerprint not in cached
+            ]
+        if not new_listings:
+            return
+
+        def cache_line(fingerprint, listing):
+            record = listing.to_dict()
+            record["fingerprint"] = fingerprint
+            return json.dumps(record) + "\n"
+
+        if len(cached) + len(new_listings) <= CACHE_SIZE:
+            with open(cache_path, 'a') as file:
+                for fingerprint, listing in new_listings:
+                    file.write(cache_line(fingerprint, listing))
+            return
+
+        # Over the limit, write the newest entries to a temp file and swap
+        # it in so a crash never leaves a half written cache
+        kept = list(cached.items()) + new_listings
+        temp_path = cache_path + ".tmp"
+        with open(temp_path, 'w') as file:
+            for fingerprint, listing in kept[-CACHE_SIZE:]:
+                file.write(cache_line(fingerprint, listing))
+        os.replace(temp_path, cache_path)
+
+    def cached_round_data(count):
+        """
+        Picks up to count listings from the listing cache that are not already
+        in this game, used when the deadline cuts scraping short.
+        """
+        if count <= 0:
+            return []
+        available = [
+            listing for fingerprint, listing in cached.items()
+            if fingerprint not in seen_fingerprints
+            ]
+        return sample(available, min(count, len(available)))
+
     def final_round_data(data):
         """
         Trims the listing data list to the final output of 5 elements.
@@ -188,9 +298,17 @@ def make_round_data(filename):
     results = []
 
     for url in url_list:
+        if request_timeout(deadline) <= 0:
+            print("Round preparation deadline reached, using cached listings.")
+            break
         result = extract_craigslist_data(url)
         if result:
             results.append(result)
+    index.save()
+
+    # Fill any missing rounds from previously scraped listings
+    results += cached_round_data(5 - len(results))
+    save_to_cache()
 
     # Trim the results for the final round
     round_data = final_round_data(results)